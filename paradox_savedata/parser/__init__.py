@@ -2,6 +2,6 @@
 Parser module for Paradox game save data
 """
 
-from .parser import parse_save_file, SaveData, save_to_file
+from .parser import parse_save_file, iter_field, SaveData, save_to_file
 
-__all__ = ["parse_save_file", "SaveData", "save_to_file"]
\ No newline at end of file
+__all__ = ["parse_save_file", "iter_field", "SaveData", "save_to_file"]
\ No newline at end of file
@@ -0,0 +1,332 @@
+# cython: language_level=3
+"""
+Cython implementation of Paradox save data parser
+
+Scans the UTF-8 bytes with a C state machine and builds the same tree as
+the pure Python tokenizer in parser.py.
+"""
+
+from sys import intern
+
+from libc.string cimport memchr, memcpy
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+from paradox_savedata.parser.parser import _pack_block
+
+
+cdef extern from "Python.h":
+    double PyOS_string_to_double(const char *s, char **endptr,
+                                 object overflow_exception) except? -1.0
+
+
+cdef enum TokenKind:
+    K_NONE
+    K_STRING
+    K_INT
+    K_FLOAT
+    K_BOOL
+    K_WORD
+    K_LBRACE
+    K_RBRACE
+    K_EQUALS
+
+
+# Character classes as bit flags, looked up in a 256 entry table so that
+# classifying a byte is one load instead of a chain of comparisons
+cdef enum:
+    F_SPACE = 1
+    F_DELIMITER = 2
+    F_DIGIT = 4
+    F_NUM_START = 8
+    F_IDENTIFIER = 16
+
+cdef unsigned char _char_flags[256]
+
+
+cdef void _init_char_flags():
+    cdef unsigned char c
+    for c in b' \t\n\r\v\f':
+        _char_flags[c] |= F_SPACE | F_DELIMITER
+    for c in b'{}=#"':
+        _char_flags[c] |= F_DELIMITER
+    for c in b'0123456789':
+        _char_flags[c] |= F_DIGIT | F_NUM_START
+    for c in b'-+.':
+        _char_flags[c] |= F_NUM_START
+    for c in b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_':
+        _char_flags[c] |= F_IDENTIFIER
+
+
+_init_char_flags()
+
+
+cdef inline bint _is_space(char c):
+    return _char_flags[<unsigned char>c] & F_SPACE
+
+
+cdef inline bint _is_delimiter(char c):
+    return _char_flags[<unsigned char>c] & F_DELIMITER
+
+
+cdef inline bint _is_digit(char c):
+    return _char_flags[<unsigned char>c] & F_DIGIT
+
+
+# Limits for sharing string values within one parse, as in parser.py
+cdef enum:
+    INTERN_MAX_LENGTH = 32
+    SHARED_VALUE_MAX_LENGTH = 128
+    SHARED_VALUE_ENTRIES = 1 << 16
+
+
+cdef inline bint _is_identifier(const char *s, Py_ssize_t n):
+    """Tell whether a short text matches [A-Za-z_][A-Za-z0-9_]*"""
+    cdef Py_ssize_t i
+    if n == 0 or n > INTERN_MAX_LENGTH or _is_digit(s[0]):
+        return False
+    for i in range(n):
+        if not _char_flags[<unsigned char>s[i]] & F_IDENTIFIER:
+            return False
+    return True
+
+
+cdef inline TokenKind _classify_word(const char *s, Py_ssize_t n):
+    """Classify a word that can't be a number as BOOL or WORD"""
+    if n == 3 and (s[0] | 0x20) == c'y' and (s[1] | 0x20) == c'e' and (s[2] | 0x20) == c's':
+        return K_BOOL
+    if n == 2 and (s[0] | 0x20) == c'n' and (s[1] | 0x20) == c'o':
+        return K_BOOL
+    return K_WORD
+
+
+cdef TokenKind _classify(const char *s, Py_ssize_t n):
+    """Classify a bare word as INT, FLOAT, BOOL or WORD"""
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t int_digits = 0
+    cdef Py_ssize_t frac_digits = 0
+
+    if not _char_flags[<unsigned char>s[0]] & F_NUM_START:
+        # Most words are identifiers; only yes/no needs a closer look
+        return _classify_word(s, n)
+
+    if s[0] == c'-' or s[0] == c'+':
+        i = 1
+    while i < n and _is_digit(s[i]):
+        i += 1
+        int_digits += 1
+    if i == n and int_digits:
+        return K_INT
+    if i < n and s[i] == c'.':
+        i += 1
+        while i < n and _is_digit(s[i]):
+            i += 1
+            frac_digits += 1
+        if i == n and (int_digits or frac_digits):
+            return K_FLOAT
+    return K_WORD
+
+
+# Longest FLOAT token converted through a copy on the stack
+cdef enum:
+    FLOAT_BUFFER_SIZE = 64
+
+
+cdef inline long long _parse_int(const char *s, Py_ssize_t n):
+    """Parse an INT token of at most 18 characters"""
+    cdef Py_ssize_t i = 0
+    cdef long long value = 0
+    cdef bint negative = s[0] == c'-'
+    if negative or s[0] == c'+':
+        i = 1
+    while i < n:
+        value = value * 10 + (s[i] - c'0')
+        i += 1
+    return -value if negative else value
+
+
+cdef object _parse_float(const char *s, Py_ssize_t n):
+    """Parse a FLOAT token"""
+    cdef char text[FLOAT_BUFFER_SIZE]
+    cdef char *end
+    if n >= FLOAT_BUFFER_SIZE:
+        return float(PyUnicode_DecodeUTF8(s, n, NULL))
+    # The token isn't NUL-terminated, and whatever follows it in the buffer
+    # (or past the end of a mapped file) must not be read as part of it
+    memcpy(text, s, n)
+    text[n] = 0
+    return PyOS_string_to_double(text, &end, None)
+
+
+cdef object _value(TokenKind kind, const char *s, Py_ssize_t n, dict shared):
+    """
+    Convert the text of a scalar token into its Python value
+
+    String values repeat throughout a save, so each distinct one is kept in
+    shared and the same object is used for every occurrence.
+    """
+    if kind == K_INT:
+        if n <= 18:
+            return _parse_int(s, n)
+        return int(PyUnicode_DecodeUTF8(s, n, NULL))
+    elif kind == K_FLOAT:
+        return _parse_float(s, n)
+    elif kind == K_BOOL:
+        return s[0] == c'y' or s[0] == c'Y'
+
+    if kind == K_STRING:
+        s += 1
+        n -= 2
+    value = PyUnicode_DecodeUTF8(s, n, NULL)
+    if n > SHARED_VALUE_MAX_LENGTH:
+        return value
+    cached = shared.get(value)
+    if cached is not None:
+        return cached
+    if _is_identifier(s, n):
+        # Also the same object as equal keys
+        value = intern(value)
+    if len(shared) < SHARED_VALUE_ENTRIES:
+        shared[value] = value
+    return value
+
+
+cdef str _key(TokenKind kind, const char *s, Py_ssize_t n):
+    """Decode the text of a token used as a key, interned since keys repeat across records"""
+    if kind == K_STRING:
+        return intern(PyUnicode_DecodeUTF8(s + 1, n - 2, NULL))
+    return intern(PyUnicode_DecodeUTF8(s, n, NULL))
+
+
+cdef inline void _store(list stack, object key, object value) except *:
+    """Store a value in the innermost open block"""
+    block = stack[-1]
+    if block is None:
+        # First entry decides the block type: numeric keys or bare values make a list
+        block = [] if key is None or key.isdigit() else {}
+        stack[-1] = block
+
+    if type(block) is list:
+        (<list>block).append(value)
+    elif key is not None:
+        (<dict>block)[key] = value
+
+
+cdef dict _parse(const char *buf, Py_ssize_t size):
+    cdef dict root = {}
+    cdef list stack = [root]  # Open blocks; None until the first entry decides dict vs list
+    cdef list block_keys = []  # Key each open block is stored under in its parent
+    cdef dict shared = {}  # String values seen so far
+    cdef object key = None  # Key waiting for its value
+    cdef TokenKind kind
+    cdef TokenKind held_kind = K_NONE  # Bare token that becomes a key if followed by '='
+    cdef Py_ssize_t held_start = 0
+    cdef Py_ssize_t held_len = 0
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t start
+    cdef const char *p
+    cdef char c
+
+    while i < size:
+        c = buf[i]
+        if _is_space(c):
+            i += 1
+            continue
+        if c == c'#':
+            p = <const char *>memchr(buf + i, c'\n', size - i)
+            i = size if p == NULL else p - buf
+            continue
+
+        start = i
+        if c == c'"':
+            p = <const char *>memchr(buf + i + 1, c'"', size - i - 1)
+            if p == NULL:
+                # Unterminated quote is skipped, like the regex tokenizer does
+                i += 1
+                continue
+            i = p - buf + 1
+            kind = K_STRING
+        elif c == c'{':
+            i += 1
+            kind = K_LBRACE
+        elif c == c'}':
+            i += 1
+            kind = K_RBRACE
+        elif c == c'=':
+            i += 1
+            kind = K_EQUALS
+        else:
+            while i < size and not _is_delimiter(buf[i]):
+                i += 1
+            kind = _classify(buf + start, i - start)
+
+        if kind == K_EQUALS:
+            if held_kind != K_NONE:
+                key = _key(held_kind, buf + held_start, held_len)
+                held_kind = K_NONE
+            continue
+
+        if held_kind != K_NONE:
+            # Previous token was not followed by '=', so it is a list item
+            _store(stack, None, _value(held_kind, buf + held_start, held_len, shared))
+            held_kind = K_NONE
+
+        if kind == K_LBRACE:
+            stack.append(None)
+            block_keys.append(key)
+            key = None
+        elif kind == K_RBRACE:
+            if len(stack) == 1:
+                # Unbalanced closing brace
+                continue
+            block = stack.pop()
+            _store(stack, block_keys.pop(), {} if block is None else _pack_block(block))
+        elif key is not None:
+            _store(stack, key, _value(kind, buf + start, i - start, shared))
+            key = None
+        else:
+            held_kind = kind
+            held_start = start
+            held_len = i - start
+
+    if held_kind != K_NONE:
+        _store(stack, None, _value(held_kind, buf + held_start, held_len, shared))
+
+    return root
+
+
+def parse_buffer(const unsigned char[::1] buf, Py_ssize_t pos=0, Py_ssize_t end=-1):
+    """
+    Parse the contents of a save file into nested dicts and lists
+
+    Args:
+        buf: UTF-8 encoded save file contents (bytes, mmap or other buffer)
+        pos: Offset where the data starts
+        end: Offset where the data ends, or -1 for the end of the buffer
+
+    Returns:
+        Raw data dictionary
+    """
+    if end < 0 or end > buf.shape[0]:
+        end = buf.shape[0]
+    if pos >= end:
+        return {}
+    return _parse(<const char *>&buf[pos], end - pos)
+
+
+def parse_save_file(file_path, namespace=False):
+    """
+    Parse a Paradox game save file
+
+    Args:
+        file_path: Path to the save file
+        namespace: Return nested blocks as NamespaceNode, see SaveData
+
+    Returns:
+        SaveData object with parsed data
+    """
+    from paradox_savedata.parser.parser import SaveData, _map_file
+
+    with _map_file(file_path) as (buf, pos):
+        data = parse_buffer(buf, pos)
+
+    return SaveData(data, file_path, namespace)
@@ -3,9 +3,73 @@ Python implementation of Paradox save data parser
 """
 
 import io
+import mmap
+import multiprocessing
 import os
 import re
-from typing import Dict, List, Union, Any, Optional, Tuple, TextIO
+import shutil
+import sys
+import weakref
+from array import array
+from collections.abc import MutableSequence
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple, TextIO, Iterable, Iterator, Union
+
+
+class _Missing:
+    """Marker for an absent value, unpickled as the same object"""
+    
+    __slots__ = ()
+    
+    def __reduce__(self):
+        return '_MISSING'
+    
+    def __repr__(self):
+        return '<missing>'
+
+
+# Default for single-lookup attribute access, and the entry of a record
+# without the field in a SoATable column
+_MISSING = _Missing()
+
+# Characters that require a string value to be quoted when saving: outside
+# quotes they end a word, and # starts a comment
+_QUOTE_CHARS = frozenset(' \t\n\r\f\v{}=#"')
+
+# Number of pieces collected before writing them out, about 64 KB of output
+_WRITE_CHUNK_PARTS = 4096
+
+
+class _Indents(dict):
+    """Indentation strings by depth, built once per depth"""
+    
+    def __missing__(self, depth: int) -> str:
+        indentation = self[depth] = '\t' * depth
+        return indentation
+
+
+_INDENTS = _Indents()
+
+
+class _ChunkedOutput:
+    """
+    Collects output pieces and writes them to the file in chunks
+    
+    Joining pieces before writing avoids a file.write() call per line while
+    keeping only one chunk of the output in memory.
+    """
+    
+    __slots__ = ('_file', 'parts', 'emit')
+    
+    def __init__(self, file: TextIO):
+        self._file = file
+        self.parts: List[str] = []
+        self.emit = self.parts.append
+    
+    def flush(self):
+        self._file.write(''.join(self.parts))
+        self.parts.clear()
 
 
 class SaveData:
@@ -15,28 +79,44 @@ class SaveData:
     Allows both dictionary-style and attribute-style access:
     - save_data["country"]["ruler"]["name"]
     - save_data.country.ruler.name
+    
+    With namespace=True, nested blocks are returned as NamespaceNode, which is
+    faster when the same values are read repeatedly.
     """
     
-    def __init__(self, data):
+    __slots__ = ('_data', '_dirty', '_raw', '_source_path', '_source_stat', '_nodes', '_top')
+    
+    def __init__(self, data, source_path: Optional[str] = None, namespace: bool = False):
+        # Nested blocks stay raw and are wrapped in SaveDataNode on access
         self._data = data
-        
-        # Convert nested dictionaries to SaveDataNode
-        for key, value in self._data.items():
-            if isinstance(value, dict):
-                self._data[key] = SaveDataNode(value)
-            elif isinstance(value, list):
-                self._data[key] = [
-                    SaveDataNode(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+        # In namespace mode, the one NamespaceNode of each block by id, for as
+        # long as the node is in use
+        self._nodes: Optional[weakref.WeakValueDictionary] = (
+            weakref.WeakValueDictionary() if namespace else None
+        )
+        # Node of the top-level block, whose cached values keep the nodes
+        # read through it alive until their block is replaced
+        self._top: Optional[NamespaceNode] = self._node(data) if namespace else None
+        # Set once the tree is modified through its nodes
+        self._dirty = False
+        # Cached result of the data property
+        self._raw = None
+        # File the data was fully parsed from, for saving it back unmodified
+        self._source_path = source_path
+        self._source_stat = os.stat(source_path) if source_path else None
     
     def __getattr__(self, name):
-        if name in self._data:
-            return self._data[name]
-        raise AttributeError(f"'SaveData' object has no attribute '{name}'")
+        value = self._data.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'SaveData' object has no attribute '{name}'")
+        if self._top is not None:
+            return self._top[name]
+        return _wrap(value, self, self._data, name)
     
     def __getitem__(self, key):
-        return self._data[key]
+        if self._top is not None:
+            return self._top[key]
+        return _wrap(self._data[key], self, self._data, key)
     
     def __contains__(self, key):
         return key in self._data
@@ -50,89 +130,118 @@ class SaveData:
         
         Example: save_data.get("country.ruler.name")
         """
-        parts = path.split('.')
-        current = self._data
+        current = self
         
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            elif isinstance(current, SaveDataNode) and part in current:
-                current = current[part]
-            else:
+        # Each step goes through the wrappers, so that changes made to the
+        # result are tracked like with attribute access
+        for part in path.split('.'):
+            if not isinstance(current, _PATH_STEPS) or part not in current:
                 return default
+            current = current[part]
                 
         return current
     
     @property
     def data(self):
-        """Return the raw data dictionary"""
-        return self._convert_to_raw(self._data)
-    
-    def _convert_to_raw(self, obj):
-        """Convert SaveDataNode objects back to raw dictionaries for serialization"""
-        if isinstance(obj, SaveDataNode):
-            return {k: self._convert_to_raw(v) for k, v in obj._data.items()}
-        elif isinstance(obj, dict):
-            return {k: self._convert_to_raw(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_to_raw(item) for item in obj]
-        else:
+        """
+        Return the raw data dictionary
+        
+        Blocks that need no conversion are shared with the tree rather than
+        copied, and the result is reused until the data is modified.
+        """
+        if self._raw is None:
+            self._raw = self._convert_to_raw(self._data)
+        return self._raw
+    
+    def _source_unchanged(self) -> bool:
+        """Check that the source file still is what the data was parsed from"""
+        if self._source_path is None:
+            return False
+        try:
+            stat = os.stat(self._source_path)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (
+            self._source_stat.st_size, self._source_stat.st_mtime_ns
+        )
+    
+    def _node(self, data: Dict[str, Any]) -> "NamespaceNode":
+        """Return the NamespaceNode of a block, created on first access"""
+        # The node references the block, so its id isn't reused while it's registered
+        node = self._nodes.get(id(data))
+        if node is None:
+            node = self._nodes[id(data)] = NamespaceNode(data, self)
+        return node
+    
+    def _mark_modified(self):
+        """Record that the tree was changed through one of its nodes"""
+        self._dirty = True
+        self._raw = None
+    
+    @staticmethod
+    def _convert_to_raw(obj):
+        """
+        Convert SoATable blocks and numeric arrays back to plain dicts and lists for serialization
+        
+        Walks the tree with an explicit stack, so deep nesting can't hit the
+        recursion limit. Only containers with something converted below them
+        are copied.
+        """
+        obj, owned = _expand(obj)
+        if type(obj) is not dict and type(obj) is not list:
             return obj
+        
+        # Each frame: [container, item iterator, key in parent, owned, converted children]
+        stack = [[obj, _iter_items(obj), None, owned, {}]]
+        while stack:
+            frame = stack[-1]
+            for key, value in frame[1]:
+                if type(value) is array:
+                    # Arrays hold only numbers, nothing to walk into
+                    frame[4][key] = value.tolist()
+                    continue
+                expanded, owned = _expand(value)
+                if type(expanded) is dict or type(expanded) is list:
+                    stack.append([expanded, _iter_items(expanded), key, owned, {}])
+                    break
+            else:
+                container, _, key, owned, converted = stack.pop()
+                if converted:
+                    if not owned:
+                        container = container.copy()
+                        owned = True
+                    for child_key, child in converted.items():
+                        container[child_key] = child
+                if not stack:
+                    return container
+                if owned:
+                    stack[-1][4][key] = container
     
     def save(self, file_path: str):
         """
         Save the data back to a Paradox save file format
         
+        If the data hasn't been modified since it was parsed, the source file is
+        copied instead of serializing the tree. Changes made to the dictionaries
+        returned by the data property aren't tracked; modify the data through
+        SaveData and its nodes.
+        
         Args:
             file_path: Path where to save the file
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            self._write_data(f, self._data)
-    
-    def _write_data(self, file: TextIO, data, indent: int = 0):
-        """Write data in Paradox format"""
-        if isinstance(data, SaveDataNode):
-            data = data._data
-            
-        if isinstance(data, dict):
-            for key, value in data.items():
-                self._write_key_value(file, key, value, indent)
-    
-    def _write_key_value(self, file: TextIO, key: str, value: Any, indent: int = 0):
-        """Write a key-value pair in Paradox format"""
-        indentation = '\t' * indent
+        if not self._dirty and self._source_unchanged():
+            try:
+                # shutil.copyfile copies in the kernel (sendfile) where the OS allows it
+                shutil.copyfile(self._source_path, file_path)
+            except shutil.SameFileError:
+                # Saving unmodified data over its own source
+                pass
+            return
         
-        if isinstance(value, SaveDataNode):
-            value = value._data
-            
-        if isinstance(value, dict):
-            file.write(f"{indentation}{key}={{\n")
-            self._write_data(file, value, indent + 1)
-            file.write(f"{indentation}}}\n")
-        elif isinstance(value, list):
-            file.write(f"{indentation}{key}={{\n")
-            for i, item in enumerate(value):
-                if isinstance(item, dict) or isinstance(item, SaveDataNode):
-                    file.write(f"{indentation}\t{i}={{\n")
-                    self._write_data(file, item, indent + 2)
-                    file.write(f"{indentation}\t}}\n")
-                else:
-                    file.write(f"{indentation}\t{i}={self._format_value(item)}\n")
-            file.write(f"{indentation}}}\n")
-        else:
-            file.write(f"{indentation}{key}={self._format_value(value)}\n")
-    
-    def _format_value(self, value: Any) -> str:
-        """Format a value for Paradox save format"""
-        if isinstance(value, bool):
-            return "yes" if value else "no"
-        elif isinstance(value, str):
-            # Quote strings if they contain spaces or special characters
-            if re.search(r'[\s{}=]', value) or not value:
-                return f'"{value}"'
-            return value
-        else:
-            return str(value)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            out = _ChunkedOutput(f)
+            _write_block(out, self._data, 0)
+            out.flush()
 
 
 class SaveDataNode:
@@ -142,43 +251,34 @@ class SaveDataNode:
     Provides attribute-like access to dictionary keys
     """
     
-    def __init__(self, data):
-        self._data = data
-        
-        # Recursively convert nested dictionaries to SaveDataNode
-        for key, value in self._data.items():
-            if isinstance(value, dict):
-                self._data[key] = SaveDataNode(value)
-            elif isinstance(value, list):
-                self._data[key] = [
-                    SaveDataNode(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+    __slots__ = ('_data', '_root')
+    
+    def __init__(self, data, root: Optional[SaveData] = None):
+        object.__setattr__(self, '_data', data)
+        # SaveData the node belongs to, told about modifications
+        object.__setattr__(self, '_root', root)
     
     def __getattr__(self, name):
-        if name in self._data:
-            return self._data[name]
-        raise AttributeError(f"'SaveDataNode' object has no attribute '{name}'")
+        value = self._data.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'SaveDataNode' object has no attribute '{name}'")
+        return _wrap(value, self._root, self._data, name)
     
     def __getitem__(self, key):
-        return self._data[key]
+        return _wrap(self._data[key], self._root, self._data, key)
     
     def __setitem__(self, key, value):
         """Allow modifying the data using dictionary access"""
-        if isinstance(value, dict) and not isinstance(value, SaveDataNode):
-            self._data[key] = SaveDataNode(value)
-        else:
-            self._data[key] = value
+        self._data[key] = _unwrap(value)
+        _mark_modified(self._root)
     
     def __setattr__(self, name, value):
         """Allow modifying the data using attribute access"""
-        if name == "_data":
-            super().__setattr__(name, value)
+        if name in SaveDataNode.__slots__:
+            object.__setattr__(self, name, value)
         else:
-            if isinstance(value, dict) and not isinstance(value, SaveDataNode):
-                self._data[name] = SaveDataNode(value)
-            else:
-                self._data[name] = value
+            self._data[name] = _unwrap(value)
+            _mark_modified(self._root)
     
     def __contains__(self, key):
         return key in self._data
@@ -187,102 +287,944 @@ class SaveDataNode:
         return f"SaveDataNode({repr(self._data)})"
 
 
-def _parse_value(value_str: str) -> Union[str, int, float, bool]:
-    """Parse a value string into the appropriate type"""
-    value_str = value_str.strip('"')
+class NamespaceNode:
+    """
+    Node in the SaveData tree of a SaveData(namespace=True)
     
-    # Try to parse as number
-    try:
-        if '.' in value_str:
-            return float(value_str)
+    Values are stored in the instance __dict__ on first access, so reading
+    them again is a plain attribute lookup that doesn't run Python code.
+    Each block has a single node, which keeps the stored values current
+    when the block is modified through any path of the tree.
+    """
+    
+    __slots__ = ('_data', '_root', '__dict__', '__weakref__')
+    
+    def __init__(self, data, root: Optional[SaveData] = None):
+        object.__setattr__(self, '_data', data)
+        # SaveData the node belongs to, told about modifications
+        object.__setattr__(self, '_root', root)
+    
+    def __getattr__(self, name):
+        # Only called for values that haven't been accessed yet
+        if name in NamespaceNode.__slots__:
+            raise AttributeError(name)
+        value = self._data.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'NamespaceNode' object has no attribute '{name}'")
+        value = self.__dict__[name] = _wrap(value, self._root, self._data, name)
+        return value
+    
+    def __getitem__(self, key):
+        value = self.__dict__.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.__dict__[key] = _wrap(self._data[key], self._root, self._data, key)
+        return value
+    
+    def __setitem__(self, key, value):
+        """Allow modifying the data using dictionary access"""
+        self._data[key] = _unwrap(value)
+        # Wrapped again on the next access
+        self.__dict__.pop(key, None)
+        _mark_modified(self._root)
+    
+    def __setattr__(self, name, value):
+        """Allow modifying the data using attribute access"""
+        if name in NamespaceNode.__slots__:
+            object.__setattr__(self, name, value)
         else:
-            return int(value_str)
-    except ValueError:
-        # Check for boolean
-        if value_str.lower() == "yes":
-            return True
-        elif value_str.lower() == "no":
-            return False
+            self[name] = value
+    
+    def __contains__(self, key):
+        return key in self._data
+    
+    def __repr__(self):
+        return f"NamespaceNode({repr(self._data)})"
+
+
+class _LazyList(MutableSequence):
+    """
+    List in the SaveData tree
+    
+    Wraps dict items in SaveDataNode as they are accessed. Also used for
+    packed numeric arrays, so that changes to them are tracked; a change the
+    array can't hold replaces it with a list in the tree.
+    """
+    
+    __slots__ = ('_items', '_root', '_parent', '_key')
+    
+    def __init__(self, items, root: Optional[SaveData] = None, parent: Any = None, key: Any = None):
+        self._items = items
+        self._root = root
+        # Container and key the items are stored under, for replacing an array
+        self._parent = parent
+        self._key = key
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _LazyList(self._items[index], self._root)
+        return _wrap(self._items[index], self._root, self._items, index)
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            values = [_unwrap(item) for item in value]
+            items = self._fit(values)
+            # Array slices only take arrays
+            items[index] = array(items.typecode, values) if type(items) is array else values
+        else:
+            value = _unwrap(value)
+            self._fit((value,))[index] = value
+        _mark_modified(self._root)
+    
+    def __delitem__(self, index):
+        del self._items[index]
+        _mark_modified(self._root)
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def insert(self, index, value):
+        value = _unwrap(value)
+        self._fit((value,)).insert(index, value)
+        _mark_modified(self._root)
+    
+    def _fit(self, values: Iterable[Any]) -> Union[list, array]:
+        """Return the items, first replaced by a list if they are an array that can't hold values"""
+        items = self._items
+        if type(items) is not array:
+            return items
+        item_type = _ARRAY_TYPES[items.typecode]
+        # Checked by type, as arrays would convert ints to floats and bools to ints
+        if all(type(value) is item_type for value in values) and (
+            item_type is float or all(value in _INT64_RANGE for value in values)
+        ):
+            return items
+        items = self._items = items.tolist()
+        if self._parent is not None:
+            self._parent[self._key] = items
+        return items
+    
+    def __eq__(self, other):
+        items, other = self._items, _unwrap(other)
+        # Packed arrays compare like the lists they stand for
+        if type(items) is array and type(other) is not array:
+            items = items.tolist()
+        elif type(other) is array and type(items) is not array:
+            other = other.tolist()
+        return items == other
+    
+    def __repr__(self):
+        return f"_LazyList({repr(self._items)})"
+
+
+class _RecordOrMethod:
+    """
+    Method of SoATable that gives way to a record of the same name
+    
+    Keeps ``table.keys`` returning the record keyed "keys", as on the dict the
+    table replaces; the method is then still available as SoATable.keys(table).
+    """
+    
+    __slots__ = ('_function',)
+    
+    def __init__(self, function):
+        self._function = function
+    
+    def __get__(self, table, owner=None):
+        if table is None:
+            return self._function
+        index = table._index
+        if index is not None and self._function.__name__ in index:
+            return Row(table, index[self._function.__name__])
+        return self._function.__get__(table, owner)
+
+
+class SoATable:
+    """
+    Block of records sharing the same fields, stored column-wise
+    
+    Replaces a dict (or list) of dicts that all have the same keys: each field
+    is a single list holding that field for every record, so a scan over one
+    field walks one list. Records are accessed through Row views, keeping
+    ``table.IRQ.name`` and ``table["IRQ"]["name"]`` working. A _MISSING entry
+    marks a field the record doesn't have. Columns of only ints or only
+    floats are packed into an array.array.
+    """
+    
+    __slots__ = ('_keys', '_index', '_columns', '_root', '_ids', '_id_positions')
+    
+    def __init__(self, keys: Optional[List[str]], columns: Dict[str, list]):
+        # Record keys, or None when the block is a list of records
+        object.__setattr__(self, '_keys', keys)
+        index = None if keys is None else {key: i for i, key in enumerate(keys)}
+        object.__setattr__(self, '_index', index)
+        object.__setattr__(self, '_columns', columns)
+        # SaveData the table belongs to, set when it is first accessed
+        object.__setattr__(self, '_root', None)
+        # Id of the record at each position, and the position of each id, that
+        # Row views hold on to. Until records are shifted an id is a position.
+        object.__setattr__(self, '_ids', None)
+        object.__setattr__(self, '_id_positions', None)
+    
+    def _position(self, key) -> int:
+        if self._keys is None:
+            return range(len(self))[key]
+        return self._index[key]
+    
+    def __getattr__(self, name):
+        if name in SoATable.__slots__:
+            # Slot not set yet, e.g. while unpickling in the parallel parser
+            raise AttributeError(name)
+        index = self._index
+        if index is not None and name in index:
+            return Row(self, index[name])
+        raise AttributeError(f"'SoATable' object has no attribute '{name}'")
+    
+    def __getitem__(self, key):
+        if isinstance(key, slice) and self._keys is None:
+            return [Row(self, position) for position in range(len(self))[key]]
+        return Row(self, self._position(key))
+    
+    def __setitem__(self, key, value):
+        """Allow replacing or adding a record"""
+        if isinstance(key, slice):
+            self._set_slice(key, [_unwrap(record) for record in value])
+            return
+        if self._keys is not None and key not in self._index:
+            self._index[key] = len(self._keys)
+            self._keys.append(key)
+            self._insert_position(len(self))
+        self._set_record(self._position(key), _unwrap(value))
+        _mark_modified(self._root)
+    
+    def __setattr__(self, name, value):
+        """Allow replacing or adding a record using attribute access"""
+        if name in SoATable.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            self[name] = value
+    
+    def __delitem__(self, key):
+        """Allow removing records by key, or by index or slice in a list of records"""
+        ids = self._record_ids()
+        if self._keys is None:
+            # Checks the index before any column is changed
+            positions = key if isinstance(key, slice) else self._position(key)
+        else:
+            positions = self._index[key]
+            del self._keys[positions]
+            self._index = {record_key: i for i, record_key in enumerate(self._keys)}
+        for column in self._columns.values():
+            del column[positions]
+        del ids[positions]
+        self._update_id_positions()
+        _mark_modified(self._root)
+    
+    def _set_slice(self, key: slice, records: List[Dict[str, Any]]):
+        """Replace a slice of a list of records, like list slice assignment"""
+        if self._keys is not None:
+            raise TypeError("slice assignment requires a list of records")
+        positions = range(len(self))[key]
+        if key.step is None or key.step == 1:
+            del self[key]
+            for offset, record in enumerate(records):
+                SoATable.insert(self, positions.start + offset, record)
+            return
+        if len(records) != len(positions):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(records)} "
+                f"to extended slice of size {len(positions)}"
+            )
+        for position, record in zip(positions, records):
+            self._set_record(position, record)
+        _mark_modified(self._root)
+    
+    def _require_list(self, method: str):
+        if self._keys is not None:
+            raise TypeError(f"{method}() requires a list of records; use table[key] = record")
+    
+    @_RecordOrMethod
+    def append(self, value):
+        """Add a record to a list of records"""
+        self._require_list("append")
+        self._insert_position(len(self))
+        self._set_record(len(self) - 1, _unwrap(value))
+        _mark_modified(self._root)
+    
+    @_RecordOrMethod
+    def insert(self, index: int, value):
+        """Insert a record into a list of records, like list.insert"""
+        self._require_list("insert")
+        size = len(self)
+        position = min(max(index + size if index < 0 else index, 0), size)
+        self._insert_position(position)
+        self._set_record(position, _unwrap(value))
+        _mark_modified(self._root)
+    
+    @_RecordOrMethod
+    def extend(self, values):
+        """Add records to a list of records"""
+        self._require_list("extend")
+        for value in values:
+            SoATable.append(self, value)
+    
+    @_RecordOrMethod
+    def pop(self, key=-1) -> Dict[str, Any]:
+        """Remove a record by key, or by index in a list of records, and return it as a dict"""
+        record = self._record(self._position(key))
+        del self[key]
+        return record
+    
+    def _insert_position(self, position: int):
+        if position < len(self) or self._ids is not None:
+            # Records after the position move, so new records get an id of their own
+            self._record_ids().insert(position, object())
+            self._update_id_positions()
+        for field, column in self._columns.items():
+            if type(column) is not list:
+                column = self._columns[field] = list(column)
+            column.insert(position, _MISSING)
+    
+    def _record_ids(self) -> List[Any]:
+        """Return the id of the record at each position, created before records first move"""
+        if self._ids is None:
+            self._ids = list(range(len(self)))
+        return self._ids
+    
+    def _update_id_positions(self):
+        self._id_positions = {record_id: i for i, record_id in enumerate(self._ids)}
+    
+    def _record_id(self, position: int) -> Any:
+        return position if self._ids is None else self._ids[position]
+    
+    def _record_position(self, record_id: Any) -> int:
+        if self._id_positions is None:
+            return record_id
+        position = self._id_positions.get(record_id)
+        if position is None:
+            raise LookupError("the record was removed from its table")
+        return position
+    
+    def _set_record(self, position: int, record: Dict[str, Any]):
+        for field in list(self._columns):
+            self._set_field(position, field, record.get(field, _MISSING))
+        for field, value in record.items():
+            if field not in self._columns:
+                self._set_field(position, field, value)
+    
+    def _set_field(self, position: int, field: str, value: Any):
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = [_MISSING] * len(self)
+        elif type(column) is not list and type(value) is not _ARRAY_TYPES[column.typecode]:
+            # Fall back to a list when the value doesn't fit the packed array
+            column = self._columns[field] = list(column)
+        column[position] = value
+        _mark_modified(self._root)
+    
+    def __len__(self):
+        return len(next(iter(self._columns.values())))
+    
+    def __iter__(self):
+        if self._keys is None:
+            return (Row(self, i) for i in range(len(self)))
+        return iter(self._keys)
+    
+    def __contains__(self, key):
+        if self._keys is None:
+            return _unwrap(key) in self._to_raw()
+        return key in self._index
+    
+    @_RecordOrMethod
+    def keys(self):
+        return list(self._keys) if self._keys is not None else list(range(len(self)))
+    
+    @_RecordOrMethod
+    def values(self):
+        return [Row(self, i) for i in range(len(self))]
+    
+    @_RecordOrMethod
+    def items(self):
+        return list(zip(SoATable.keys(self), SoATable.values(self)))
+    
+    @_RecordOrMethod
+    def column(self, field: str) -> Union[list, array]:
+        """
+        Return the raw list or array holding one field for every record
         
-        # Return as string
-        return value_str
-
-
-def _parse_block(lines: List[str], start_idx: int) -> Tuple[Dict[str, Any], int]:
-    """Parse a block of save data"""
-    result = {}
-    i = start_idx
-    brace_count = 0
-    in_block = False
-    current_key = None
-    value_buffer = []
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        i += 1
+        The column is meant for reading; modify records through the table.
+        Records without the field hold the _MISSING marker.
         
-        # Skip empty lines and comments
-        if not line or line.startswith('#'):
+        Example: sum(countries.column("treasury"))
+        """
+        return self._columns[field]
+    
+    def _record(self, position: int) -> Dict[str, Any]:
+        return {
+            field: column[position]
+            for field, column in self._columns.items()
+            if column[position] is not _MISSING
+        }
+    
+    def _records(self) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Yield (key or index, record dict) pairs"""
+        keys = self._keys if self._keys is not None else range(len(self))
+        for position, key in enumerate(keys):
+            yield key, self._record(position)
+    
+    def _to_raw(self):
+        if self._keys is None:
+            return [record for _, record in self._records()]
+        return dict(self._records())
+    
+    def __eq__(self, other):
+        if isinstance(other, SoATable):
+            other = other._to_raw()
+        return self._to_raw() == other
+    
+    def __repr__(self):
+        return f"SoATable({repr(self._to_raw())})"
+
+
+class Row:
+    """
+    View of one record in a SoATable
+    
+    Provides the same access as SaveDataNode. The view follows its record
+    when records before it are inserted or removed.
+    """
+    
+    __slots__ = ('_table', '_id')
+    
+    def __init__(self, table: SoATable, position: int):
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_id', table._record_id(position))
+    
+    @property
+    def _position(self) -> int:
+        return self._table._record_position(self._id)
+    
+    def __getattr__(self, name):
+        column = self._table._columns.get(name)
+        if column is not None:
+            position = self._position
+            if column[position] is not _MISSING:
+                # Stored back through the row, which knows the record's current position
+                return _wrap(column[position], self._table._root, self, name)
+        raise AttributeError(f"'Row' object has no attribute '{name}'")
+    
+    def __getitem__(self, key):
+        column = self._table._columns.get(key)
+        position = self._position
+        if column is None or column[position] is _MISSING:
+            raise KeyError(key)
+        return _wrap(column[position], self._table._root, self, key)
+    
+    def __setitem__(self, key, value):
+        """Allow modifying the data using dictionary access"""
+        self._table._set_field(self._position, key, _unwrap(value))
+    
+    def __setattr__(self, name, value):
+        """Allow modifying the data using attribute access"""
+        self._table._set_field(self._position, name, _unwrap(value))
+    
+    def __contains__(self, key):
+        column = self._table._columns.get(key)
+        return column is not None and column[self._position] is not _MISSING
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        return self._table._record(self._position)
+    
+    def __eq__(self, other):
+        return self._to_dict() == _unwrap(other)
+    
+    def __repr__(self):
+        return f"Row({repr(self._to_dict())})"
+
+
+# Types SaveData.get() can take a step into
+_PATH_STEPS = (SaveData, SaveDataNode, NamespaceNode, SoATable, Row)
+
+
+def _wrap(value: Any, root: Optional[SaveData] = None, parent: Any = None, key: Any = None) -> Any:
+    """
+    Wrap a raw dict or list from the tree for attribute-style access
+    
+    parent[key] is where the value is stored, so that a packed array can be
+    replaced by a list when a change doesn't fit it.
+    """
+    if type(value) is dict:
+        if root is not None and root._nodes is not None:
+            return root._node(value)
+        return SaveDataNode(value, root)
+    if type(value) is list or type(value) is array:
+        return _LazyList(value, root, parent, key)
+    if type(value) is SoATable:
+        object.__setattr__(value, '_root', root)
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    """Return the raw dict or list behind a wrapped value before storing it in the tree"""
+    if isinstance(value, (SaveDataNode, NamespaceNode)):
+        return value._data
+    if isinstance(value, _LazyList):
+        return value._items
+    if isinstance(value, Row):
+        return value._to_dict()
+    return value
+
+
+def _mark_modified(root: Optional[SaveData]) -> None:
+    """Tell the owning SaveData, if any, that its tree was modified"""
+    if root is not None:
+        root._mark_modified()
+
+
+def _expand(value: Any) -> Tuple[Any, bool]:
+    """
+    Return the plain dict or list form of a value from the tree
+    
+    The flag tells whether the result was newly built and may be modified.
+    """
+    if type(value) is SoATable:
+        return value._to_raw(), True
+    if type(value) is array:
+        return value.tolist(), True
+    if isinstance(value, (SaveDataNode, NamespaceNode, _LazyList, Row)):
+        return _expand(_unwrap(value))[0], isinstance(value, Row)
+    return value, False
+
+
+def _iter_items(container: Union[dict, list]) -> Iterator[Tuple[Any, Any]]:
+    """Iterate over (key, value) pairs of a dict or (index, item) pairs of a list"""
+    return iter(container.items()) if type(container) is dict else enumerate(container)
+
+
+class _TypeDispatch(dict):
+    """
+    Handlers by exact type. A type without its own handler uses the one of
+    its nearest registered base class, or the default, resolved once per type.
+    """
+    
+    def __init__(self, handlers: Dict[type, Any], default: Any):
+        super().__init__(handlers)
+        self._default = default
+    
+    def __missing__(self, value_type: type) -> Any:
+        handler = next(
+            (self[base] for base in value_type.__mro__[1:] if base in self), self._default
+        )
+        self[value_type] = handler
+        return handler
+
+
+def _format_str(value: str) -> str:
+    # Quote strings if they contain spaces or special characters
+    if not value or not _QUOTE_CHARS.isdisjoint(value):
+        return f'"{value}"'
+    return value
+
+
+def _write_block(out: _ChunkedOutput, data: Dict[str, Any], indent: int) -> None:
+    """Write the entries of a dict in Paradox format"""
+    parts = out.parts
+    writers = _WRITERS
+    for key, value in data.items():
+        writers[type(value)](out, key, value, indent)
+        if len(parts) >= _WRITE_CHUNK_PARTS:
+            out.flush()
+
+
+def _write_scalar(out: _ChunkedOutput, key: Any, value: Any, indent: int) -> None:
+    # Any other type, written as its str()
+    out.emit(f"{_INDENTS[indent]}{key}={value}\n")
+
+
+def _write_bool(out: _ChunkedOutput, key: Any, value: bool, indent: int) -> None:
+    out.emit(f"{_INDENTS[indent]}{key}={'yes' if value else 'no'}\n")
+
+
+def _write_str(out: _ChunkedOutput, key: Any, value: str, indent: int) -> None:
+    out.emit(f"{_INDENTS[indent]}{key}={_format_str(value)}\n")
+
+
+def _write_number(out: _ChunkedOutput, key: Any, value: Union[int, float], indent: int) -> None:
+    out.emit(f"{_INDENTS[indent]}{key}={value}\n")
+
+
+def _write_dict(out: _ChunkedOutput, key: Any, value: Dict[str, Any], indent: int) -> None:
+    indentation = _INDENTS[indent]
+    out.emit(f"{indentation}{key}={{\n")
+    _write_block(out, value, indent + 1)
+    out.emit(f"{indentation}}}\n")
+
+
+def _write_node(
+    out: _ChunkedOutput, key: Any, value: Union[SaveDataNode, NamespaceNode], indent: int
+) -> None:
+    _write_dict(out, key, value._data, indent)
+
+
+def _write_list(out: _ChunkedOutput, key: Any, value: list, indent: int) -> None:
+    indentation = _INDENTS[indent]
+    emit = out.emit
+    writers = _WRITERS
+    parts = out.parts
+    emit(f"{indentation}{key}={{\n")
+    for i, item in enumerate(value):
+        writers[type(item)](out, i, item, indent + 1)
+        if len(parts) >= _WRITE_CHUNK_PARTS:
+            out.flush()
+    emit(f"{indentation}}}\n")
+
+
+def _write_array(out: _ChunkedOutput, key: Any, value: array, indent: int) -> None:
+    # Items are all ints or all floats, written as they are
+    indentation = _INDENTS[indent]
+    emit = out.emit
+    parts = out.parts
+    emit(f"{indentation}{key}={{\n")
+    for i, item in enumerate(value):
+        emit(f"{indentation}\t{i}={item}\n")
+        if len(parts) >= _WRITE_CHUNK_PARTS:
+            out.flush()
+    emit(f"{indentation}}}\n")
+
+
+def _write_table(out: _ChunkedOutput, key: Any, value: SoATable, indent: int) -> None:
+    indentation = _INDENTS[indent]
+    out.emit(f"{indentation}{key}={{\n")
+    for record_key, record in value._records():
+        _write_dict(out, record_key, record, indent + 1)
+    out.emit(f"{indentation}}}\n")
+
+
+# Writers of key=value pairs by value type, so that writing a value is one
+# dict lookup instead of a chain of isinstance checks
+_WRITERS = _TypeDispatch({
+    bool: _write_bool,
+    str: _write_str,
+    int: _write_number,
+    float: _write_number,
+    dict: _write_dict,
+    SaveDataNode: _write_node,
+    NamespaceNode: _write_node,
+    list: _write_list,
+    array: _write_array,
+    SoATable: _write_table,
+}, _write_scalar)
+
+
+# Token patterns, tried in order at each position. Numeric and boolean
+# patterns only match whole words so that e.g. ``1936.1.1`` stays a WORD.
+_TOKEN_RE = re.compile(rb"""
+    (?P<COMMENT>\#[^\n]*)
+  | (?P<STRING>"[^"]*")
+  | (?P<LBRACE>\{)
+  | (?P<RBRACE>\})
+  | (?P<EQUALS>=)
+  | (?P<INT>[-+]?\d+)(?![^\s{}=\#"])
+  | (?P<FLOAT>[-+]?(?:\d+\.\d*|\.\d+))(?![^\s{}=\#"])
+  | (?P<BOOL>(?i:yes|no))(?![^\s{}=\#"])
+  | (?P<WORD>[^\s{}=\#"]+)
+""", re.VERBOSE)
+
+# Braces outside strings and comments, for splitting at top-level blocks
+_BRACE_RE = re.compile(rb'[{}]|"[^"]*"|\#[^\n]*')
+
+# Smallest span handed to a worker process by parse_save_file(parallel=True)
+_MIN_SPAN_SIZE = 1 << 20
+
+# Convert the raw bytes of a scalar token into its Python value
+_CONVERTERS = {
+    "STRING": lambda text: text[1:-1].decode('utf-8'),
+    "INT": int,
+    "FLOAT": float,
+    "BOOL": lambda text: text[0] in b"yY",
+    "WORD": lambda text: text.decode('utf-8'),
+}
+
+# Longest identifier-like string value that is interned, e.g. tags and ideologies
+_INTERN_MAX_LENGTH = 32
+
+# Longest string value token, and most distinct ones, shared within one parse
+_SHARED_VALUE_MAX_LENGTH = 128
+_SHARED_VALUE_ENTRIES = 1 << 16
+
+
+def _converters() -> Dict[str, Any]:
+    """
+    Return the token converters for one parse
+    
+    String values repeat throughout a save, so each distinct value is decoded
+    once and the same str object is used for every occurrence. Short
+    identifier-like values are interned as well, making them the same
+    object as equal keys.
+    """
+    shared: Dict[bytes, str] = {}
+    
+    def convert(text: bytes) -> str:
+        value = shared.get(text)
+        if value is None:
+            # Only STRING tokens start with a quote
+            value = (text[1:-1] if text[0] == 0x22 else text).decode('utf-8')
+            if len(value) <= _INTERN_MAX_LENGTH and value.isascii() and value.isidentifier():
+                value = sys.intern(value)
+            if len(text) <= _SHARED_VALUE_MAX_LENGTH and len(shared) < _SHARED_VALUE_ENTRIES:
+                shared[text] = value
+        return value
+    
+    return {**_CONVERTERS, "STRING": convert, "WORD": convert}
+
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+Buffer = Union[bytes, mmap.mmap]
+Token = Tuple[str, bytes]
+
+
+@contextmanager
+def _map_file(file_path: str) -> Iterator[Tuple[Buffer, int]]:
+    """
+    Memory-map a save file for reading
+    
+    Yields the mapped buffer and the offset where the data starts (after the
+    UTF-8 BOM, if any). Pages are read in by the OS as the tokenizer walks them.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            # Empty files can't be mapped
+            yield b'', 0
+            return
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    
+    try:
+        yield mm, 3 if mm[:3] == _UTF8_BOM else 0
+    finally:
+        try:
+            mm.close()
+        except BufferError:
+            # A token iterator abandoned by an exception still holds the buffer;
+            # the mapping is released when it is garbage collected
+            pass
+
+
+def _tokenize(buf: Buffer, pos: int = 0, end: Optional[int] = None) -> Iterator[Token]:
+    """Yield ``(kind, text)`` tokens from the whole buffer in a single pass"""
+    for match in _TOKEN_RE.finditer(buf, pos, len(buf) if end is None else end):
+        kind = match.lastgroup
+        if kind != "COMMENT":
+            yield kind, match.group()
+
+
+def _store(stack: List[Any], key: Optional[str], value: Any) -> None:
+    """Store a value in the innermost open block"""
+    block = stack[-1]
+    if block is None:
+        # First entry decides the block type: numeric keys or bare values make a list
+        block = [] if key is None or key.isdigit() else {}
+        stack[-1] = block
+
+    if type(block) is list:
+        block.append(value)
+    elif key is not None:
+        block[key] = value
+
+
+# array.array typecodes for packed numeric lists, and the item type of each
+_ARRAY_TYPECODES = {int: 'q', float: 'd'}
+_ARRAY_TYPES = {typecode: item_type for item_type, typecode in _ARRAY_TYPECODES.items()}
+
+# Values an array.array('q') item can hold
+_INT64_RANGE = range(-(1 << 63), 1 << 63)
+
+
+def _pack_numbers(items: list) -> Union[list, array]:
+    """Store a list of only ints or only floats as an array.array"""
+    if not items:
+        return items
+    item_type = type(items[0])
+    typecode = _ARRAY_TYPECODES.get(item_type)
+    if typecode is None:
+        return items
+    for item in items:
+        if type(item) is not item_type:
+            return items
+    try:
+        return array(typecode, items)
+    except OverflowError:
+        # Integers beyond 64 bits stay Python ints
+        return items
+
+
+def _pack_block(block: Any) -> Any:
+    """
+    Choose the storage for a parsed block
+    
+    Blocks of at least two records with the same fields become a SoATable,
+    and numeric lists become an array.array.
+    """
+    records = block.values() if type(block) is dict else block
+    if len(records) < 2:
+        return block if type(block) is dict else _pack_numbers(block)
+    
+    first = next(iter(records))
+    if type(first) is not dict or not first:
+        return block if type(block) is dict else _pack_numbers(block)
+    fields = tuple(first)
+    for record in records:
+        if type(record) is not dict or tuple(record) != fields:
+            return block
+    
+    columns = {field: _pack_numbers([record[field] for record in records]) for field in fields}
+    return SoATable(list(block) if type(block) is dict else None, columns)
+
+
+def _parse_block(tokens: Iterable[Token]) -> Dict[str, Any]:
+    """
+    Build the data tree from a token stream using an explicit stack
+
+    Every token is consumed exactly once; nested blocks are built in place
+    as their tokens arrive rather than being collected and parsed again.
+    """
+    root: Dict[str, Any] = {}
+    stack: List[Any] = [root]  # Open blocks; None until the first entry decides dict vs list
+    block_keys: List[Optional[str]] = []  # Key each open block is stored under in its parent
+    current: Any = root  # Innermost open block, i.e. stack[-1]
+    key = None  # Key waiting for its value
+    held = None  # Bare token that becomes a key if followed by '='
+    converters = _converters()
+
+    for token in tokens:
+        kind = token[0]
+        if kind == "EQUALS":
+            if held is not None:
+                held_kind, held_text = held
+                # Keys repeat across records, so share one string object per key
+                key = sys.intern(
+                    (held_text[1:-1] if held_kind == "STRING" else held_text).decode('utf-8')
+                )
+                held = None
             continue
-            
-        # Count braces to track nested blocks
-        brace_count += line.count('{') - line.count('}')
-        
-        # Check for end of block
-        if brace_count < 0:
-            break
-            
-        # Check for key-value pair
-        if '=' in line and not in_block:
-            # Split on first equals sign
-            parts = line.split('=', 1)
-            key = parts[0].strip()
-            value = parts[1].strip()
-            
-            # Check if value is a block
-            if value.endswith('{'):
-                current_key = key
-                in_block = True
-                brace_count = 1  # We're in a block now
-                value_buffer = []
+
+        if held is not None:
+            # Previous token was not followed by '=', so it is a list item
+            _store(stack, None, converters[held[0]](held[1]))
+            current = stack[-1]
+            held = None
+
+        if kind == "LBRACE":
+            stack.append(None)
+            block_keys.append(key)
+            current = None
+            key = None
+        elif kind == "RBRACE":
+            if len(stack) == 1:
+                # Unbalanced closing brace
+                continue
+            block = stack.pop()
+            _store(stack, block_keys.pop(), {} if block is None else _pack_block(block))
+            current = stack[-1]
+        elif key is not None:
+            if type(current) is dict:
+                # Common case of a key=value pair in a dict block
+                current[key] = converters[kind](token[1])
             else:
-                # Handle simple key-value
-                result[key] = _parse_value(value)
-                
-        elif in_block:
-            value_buffer.append(line)
-            
-            # Check if block ended
-            if brace_count == 0:
-                # Parse the block contents
-                block_str = ' '.join(value_buffer)
-                
-                # Check if it's a list or dictionary
-                if re.match(r'^\s*\d+\s*=', block_str):
-                    # Looks like a list in disguise (keys are numeric indices)
-                    list_items = re.findall(r'\d+\s*=\s*([^={}]+|\{[^}]*\})', block_str)
-                    result[current_key] = [_parse_value(item.strip()) for item in list_items]
-                else:
-                    # Regular nested block
-                    sub_block, _ = _parse_block(value_buffer, 0)
-                    result[current_key] = sub_block
-                    
-                in_block = False
-                current_key = None
-                value_buffer = []
-                
-    return result, i
+                _store(stack, key, converters[kind](token[1]))
+                current = stack[-1]
+            key = None
+        else:
+            held = token
+
+    if held is not None:
+        _store(stack, None, converters[held[0]](held[1]))
+
+    return root
+
+
+def _python_tokenizer():
+    """Return the Numba tokenizer as an optional speed boost, or the regex one"""
+    try:
+        from ._numba_scan import tokenize
+    except ImportError:
+        tokenize = _tokenize
+    return tokenize
+
+
+def _parse_buffer(buf: Buffer, pos: int = 0, end: Optional[int] = None) -> Dict[str, Any]:
+    """Parse part of a buffer with the fastest available implementation"""
+    try:
+        from . import _cparser
+        return _cparser.parse_buffer(buf, pos, -1 if end is None else end)
+    except ImportError:
+        pass
+    return _parse_block(_python_tokenizer()(buf, pos, end))
+
+
+def _split_top_level(buf: Buffer, pos: int, min_size: int) -> List[Tuple[int, int]]:
+    """
+    Split a buffer into spans of complete top-level entries
+    
+    Spans end right after the closing brace of a top-level block, so each
+    one can be parsed on its own. Consecutive blocks are kept together
+    until a span is at least min_size bytes.
+    """
+    spans = []
+    start = pos
+    depth = 0
+    for match in _BRACE_RE.finditer(buf, pos):
+        brace = match.group()
+        if brace == b'{':
+            depth += 1
+        elif brace == b'}':
+            # Unbalanced closing braces are ignored, as in _parse_block
+            depth = max(depth - 1, 0)
+            if depth == 0 and match.end() - start >= min_size:
+                spans.append((start, match.end()))
+                start = match.end()
+    spans.append((start, len(buf)))
+    return spans
 
 
-def parse_save_file(file_path: str) -> SaveData:
+def _parse_span(task: Tuple[str, int, int]) -> Dict[str, Any]:
+    """Parse one span of a save file in a worker process"""
+    file_path, start, end = task
+    with _map_file(file_path) as (buf, _):
+        return _parse_buffer(buf, start, end)
+
+
+def _parse_parallel(file_path: str, processes: Optional[int] = None) -> Dict[str, Any]:
+    """Parse the top-level blocks of a save file in a process pool and merge them"""
+    processes = processes or os.cpu_count() or 1
+    with _map_file(file_path) as (buf, pos):
+        # A few spans per process evens out blocks of different sizes
+        spans = _split_top_level(buf, pos, max(len(buf) // (processes * 4), _MIN_SPAN_SIZE))
+        if len(spans) == 1:
+            return _parse_buffer(buf, pos)
+    
+    data: Dict[str, Any] = {}
+    with multiprocessing.Pool(processes=min(processes, len(spans))) as pool:
+        # imap keeps file order, so repeated keys resolve as in a serial parse
+        for part in pool.imap(_parse_span, [(file_path, start, end) for start, end in spans]):
+            data.update(part)
+    return data
+
+
+def parse_save_file(file_path: str, parallel: bool = False, namespace: bool = False) -> SaveData:
     """
     Parse a Paradox game save file
     
     This is a pure Python implementation that should work but will be slow
-    for large files. For better performance, use the Rust implementation when available.
+    for large files. For better performance, use the Rust implementation when available,
+    or the Cython implementation when the Rust one isn't built.
     
     Args:
         file_path: Path to the save file
+        parallel: Parse top-level blocks in a process pool; worthwhile for large saves
+        namespace: Return nested blocks as NamespaceNode, see SaveData
         
     Returns:
         SaveData object with parsed data
@@ -290,22 +1232,167 @@ def parse_save_file(file_path: str) -> SaveData:
     try:
         # Check if Rust implementation is available
         from . import rust_parser
-        return rust_parser.parse_save_file(file_path)
+        save_data = rust_parser.parse_save_file(file_path)
+        return SaveData(save_data._data, namespace=True) if namespace else save_data
+    except ImportError:
+        pass
+    
+    if parallel:
+        return SaveData(_parse_parallel(file_path), file_path, namespace)
+    
+    try:
+        # Check if Cython implementation is available
+        from . import _cparser
+        return _cparser.parse_save_file(file_path, namespace)
     except ImportError:
         # Fall back to Python implementation
         print("Warning: Using slower Python parser. Install Rust implementation for better performance.")
-        
-    # Read file content
-    with open(file_path, 'r', encoding='utf-8-sig') as f:
-        content = f.read()
     
-    # Split into lines
-    lines = content.split('\n')
+    # Parse root block straight from the mapped file
+    with _map_file(file_path) as (buf, pos):
+        data = _parse_block(_python_tokenizer()(buf, pos))
+    
+    return SaveData(data, file_path, namespace)
+
+
+def _key_text(token: Token) -> str:
+    """Decode a token used as a key"""
+    kind, text = token
+    return (text[1:-1] if kind == "STRING" else text).decode('utf-8')
+
+
+def _block_end(buf: Buffer, pos: int) -> int:
+    """Return the offset right after the closing brace of a block whose contents start at pos"""
+    depth = 1
+    for match in _BRACE_RE.finditer(buf, pos):
+        brace = match.group()
+        if brace == b'{':
+            depth += 1
+        elif brace == b'}':
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return len(buf)
+
+
+def _match_field(buf: Buffer, pos: int, pattern: List[str]) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yield (record key, value) for the entries of a buffer that match a path pattern
+    
+    Blocks the path doesn't lead into are skipped by their braces alone,
+    without tokenizing their contents. Entries get the keys they have in the
+    tree: those of a list block are their indexes.
+    """
+    last = len(pattern) - 1
+    # Path level whose key is reported with each value
+    record_level = max((i for i, part in enumerate(pattern) if part == '*'), default=last)
+    keys: List[Any] = []  # Key of each open block; only blocks the path leads into are opened
+    lists: List[Optional[bool]] = [False]  # Whether each open block is a list, None until known
+    counts = [0]  # Entries seen so far in each open list block, their keys are their indexes
+    key = None  # Key waiting for its value
+    held = None  # Bare token that becomes a key if followed by '='
+    
+    def stored_key(entry_key: Optional[str]) -> Any:
+        # Same rule as _store: numeric keys or bare values first make a list
+        is_list = lists[-1]
+        if is_list is None:
+            is_list = lists[-1] = entry_key is None or entry_key.isdigit()
+        if is_list:
+            index = counts[-1]
+            counts[-1] += 1
+            return index
+        # None for a bare value, which a dict block doesn't keep
+        return entry_key
     
-    # Parse root block
-    data, _ = _parse_block(lines, 0)
+    def matches(entry_key: Any) -> bool:
+        part = pattern[len(keys)]
+        return part == '*' or part == (entry_key if type(entry_key) is str else str(entry_key))
+    
+    def record(entry_key: Any, value: Any) -> Tuple[Any, Any]:
+        return (entry_key if record_level == last else keys[record_level], value)
+    
+    while True:
+        for match in _TOKEN_RE.finditer(buf, pos):
+            kind = match.lastgroup
+            if kind == "COMMENT":
+                continue
+            if kind == "EQUALS":
+                if held is not None:
+                    key = _key_text(held)
+                    held = None
+                continue
+            
+            if held is not None:
+                # Previous token was not followed by '=', so it is a list item
+                index = stored_key(None)
+                if index is not None and len(keys) == last and matches(index):
+                    yield record(index, _CONVERTERS[held[0]](held[1]))
+                held = None
+            
+            if kind == "LBRACE":
+                key = stored_key(key)
+                if key is not None and matches(key) and len(keys) < last:
+                    keys.append(key)
+                    lists.append(None)
+                    counts.append(0)
+                    key = None
+                    continue
+                
+                # Step over the block, building it only if it is the field itself
+                pos = _block_end(buf, match.end())
+                if key is not None and matches(key):
+                    # Stored under a placeholder key, as the block may be a list item
+                    tokens = _tokenize(buf, match.start(), pos)
+                    block = _parse_block(chain([("WORD", b"_"), ("EQUALS", b"=")], tokens))
+                    # A block left open at the end of the file is dropped, as by the full parse
+                    if "_" in block:
+                        yield record(key, SaveData._convert_to_raw(block["_"]))
+                key = None
+                break
+            elif kind == "RBRACE":
+                if keys:
+                    keys.pop()
+                    lists.pop()
+                    counts.pop()
+            elif key is not None:
+                key = stored_key(key)
+                if len(keys) == last and matches(key):
+                    yield record(key, _CONVERTERS[kind](match.group()))
+                key = None
+            else:
+                held = (kind, match.group())
+        else:
+            break
     
-    return SaveData(data)
+    if held is not None:
+        index = stored_key(None)
+        if index is not None and len(keys) == last and matches(index):
+            yield record(index, _CONVERTERS[held[0]](held[1]))
+
+
+def iter_field(path: str, file_path: str) -> Iterator[Tuple[Any, Any]]:
+    """
+    Stream the values of one field from a save file without building the tree
+    
+    The path is dot-separated like in SaveData.get, and * matches any key or
+    list index. Blocks the path doesn't lead into are skipped, and the file is
+    tokenized as it is read, so memory use doesn't grow with the file. Values
+    come in file order, including repeated keys, and matched blocks are
+    returned as plain data like SaveData.data.
+    
+    Example: dict(iter_field("countries.*.treasury", "path/to/save.hoi4"))
+    
+    Args:
+        path: Path of the field
+        file_path: Path to the save file
+        
+    Yields:
+        (key, value) pairs, where key is the key matched by the last * of the
+        path, or the last key of a path without *. Keys are as in the tree, so
+        the entries of a list block, like ``{ 5=a 9=b }``, have their indexes.
+    """
+    with _map_file(file_path) as (buf, pos):
+        yield from _match_field(buf, pos, path.split('.'))
 
 
 def save_to_file(save_data: SaveData, file_path: str) -> None:
@@ -1,6 +1,16 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 from setuptools_rust import RustExtension, Binding
 
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("paradox_savedata.parser._cparser", ["paradox_savedata/parser/_cparser.pyx"])],
+        language_level=3,
+    )
+except ImportError:
+    # The Cython parser is optional; the pure Python one is used without it
+    ext_modules = []
+
 
 setup(
     name="paradox-savedata",
@@ -15,6 +25,7 @@ setup(
             binding=Binding.PyO3,
         )
     ],
+    ext_modules=ext_modules,
     zip_safe=False,
     python_requires=">=3.7",
     install_requires=[],
@@ -3,14 +3,36 @@
 Script to compare the output of Python and Rust implementations of the paradox-savedata parser
 """
 
+import hashlib
 import json
+import os
 import sys
 import importlib
+import tempfile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Sample file path
 SAMPLE_FILE = "examples/sample_saves/sample.hoi4"
 
+def _dumps(obj):
+    """Serialize to sorted, indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits
+            pass
+    return json.dumps(obj, sort_keys=True, indent=2).encode()
+
+def _digest(obj):
+    """Hash the serialized form, so only one serialization is held at a time"""
+    return hashlib.sha256(_dumps(obj)).digest()
+
 def get_python_implementation_result():
     """Force the use of Python implementation and parse the sample file"""
     # Temporarily modify sys.modules to remove rust_parser if it's loaded
@@ -65,12 +87,8 @@ def compare_results(python_result, rust_result):
         print("Cannot compare: Rust implementation is not available")
         return
     
-    # Convert to JSON strings for easier comparison
-    python_json = json.dumps(python_result, sort_keys=True, indent=2)
-    rust_json = json.dumps(rust_result, sort_keys=True, indent=2)
-    
-    # Check if the results are identical
-    if python_json == rust_json:
+    # Compare hashes of the serialized results
+    if _digest(python_result) == _digest(rust_result):
         print("✅ Both implementations return identical results")
     else:
         print("❌ The implementations return different results")
@@ -157,6 +175,117 @@ def compare_results(python_result, rust_result):
         else:
             print("❌ Difference in parsing boolean values")
 
+# Syntax the parser backends could disagree on, ending in a number with no newline
+EDGE_CASES = (
+    b"\xef\xbb\xbf"  # UTF-8 BOM
+    b"# comment with { braces }\n"
+    b"date=1936.1.1\n"
+    b"plus=+5\n"
+    b"minus=-7\n"
+    b"fraction=.5\n"
+    b"exponent=1.25e3\n"
+    b"flags={ yes NO no YES }\n"
+    b"mixed={ 1 2.5 yes word \"quoted text\" }\n"
+    b"big=123456789012345678901234567890\n"
+    b"negative_big=-98765432109876543210\n"
+    b"empty={ }\n"
+    b"records={ { a=1 b=2 } { a=3 b=4 } }\n"
+    b"ids={ 1={ x=1 } 2={ x=2 } }\n"
+    b"name=\"\xc3\xbc \xe6\x97\xa5\"\n"
+    b"broken=\"unterminated\n"
+    b"last=42"
+)
+
+def _parser_backends():
+    """Return (name, parse function) for every parser backend available here"""
+    from paradox_savedata.parser import parser
+    
+    def parse_regex(path):
+        with parser._map_file(path) as (buf, pos):
+            return parser._parse_block(parser._tokenize(buf, pos))
+    
+    def parse_parallel(path):
+        # Split at every top-level block so that several spans are merged
+        min_span_size = parser._MIN_SPAN_SIZE
+        parser._MIN_SPAN_SIZE = 1
+        try:
+            return parser._parse_parallel(path, processes=2)
+        finally:
+            parser._MIN_SPAN_SIZE = min_span_size
+    
+    backends = [("regex", parse_regex)]
+    try:
+        from paradox_savedata.parser import _numba_scan
+    except ImportError:
+        print("  Numba tokenizer is not available. Skipping it.")
+    else:
+        def parse_numba(path):
+            with parser._map_file(path) as (buf, pos):
+                return parser._parse_block(_numba_scan.tokenize(buf, pos))
+        backends.append(("numba", parse_numba))
+    try:
+        from paradox_savedata.parser import _cparser
+    except ImportError:
+        print("  Cython implementation is not available. Skipping it.")
+    else:
+        backends.append(("cython", lambda path: _cparser.parse_save_file(path)._data))
+    backends.append(("parallel", parse_parallel))
+    return backends
+
+def check_backend_parity():
+    """Check that every available parser backend returns the same data"""
+    from paradox_savedata.parser import SaveData
+    
+    fd, edge_file = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(fd, "wb") as f:
+        f.write(EDGE_CASES)
+    try:
+        backends = _parser_backends()
+        for path in (SAMPLE_FILE, edge_file):
+            name = "edge cases" if path == edge_file else path
+            results = {
+                backend: SaveData(parse(path)).data for backend, parse in backends
+            }
+            expected = results.pop("regex")
+            for backend, result in results.items():
+                if result == expected:
+                    print(f"  ✓ {backend} matches the regex tokenizer on {name}")
+                else:
+                    print(f"  ❌ {backend} differs from the regex tokenizer on {name}")
+                    print(f"    regex:    {expected}")
+                    print(f"    {backend}: {result}")
+    finally:
+        os.remove(edge_file)
+
+def check_number_at_end_of_buffer():
+    """Check that the Cython parser doesn't read past a number ending the data"""
+    try:
+        from paradox_savedata.parser import _cparser
+    except ImportError:
+        print("  Cython implementation is not available. Skipping check.")
+        return
+    
+    # A file of whole pages has no bytes mapped after its last character
+    size = 4 << 20
+    for tail, expected in ((b"x=123", 123), (b"x=1.5", 1.5)):
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b" " * (size - len(tail)) + tail)
+            value = _cparser.parse_save_file(path)._data.get("x")
+        finally:
+            os.remove(path)
+        if value == expected:
+            print(f"  ✓ {size >> 20} MiB file ending in {tail.decode()} parses to {value!r}")
+        else:
+            print(f"  ❌ {size >> 20} MiB file ending in {tail.decode()} parses to {value!r}")
+    
+    # Numbers are cut at the end argument
+    for buf, end, expected in ((b"x=1234", 3, {"x": 1}), (b"a=1.25e3", 5, {"a": 1.2})):
+        result = _cparser.parse_buffer(buf, 0, end)
+        mark = "✓" if result == expected else "❌"
+        print(f"  {mark} parse_buffer({buf!r}, 0, {end}) = {result}")
+
 def main():
     print("Testing parser implementations with sample file:", SAMPLE_FILE)
     
@@ -169,14 +298,20 @@ def main():
     print("\n3. Comparing results...")
     compare_results(python_result, rust_result)
     
+    print("\n4. Comparing parser backends...")
+    check_backend_parity()
+    
+    print("\n5. Checking numbers at the end of the buffer...")
+    check_number_at_end_of_buffer()
+    
     # Save results to files for manual inspection
-    with open("python_result.json", "w") as f:
-        json.dump(python_result, f, indent=2)
+    with open("python_result.json", "wb") as f:
+        f.write(_dumps(python_result))
     print("\nPython result saved to python_result.json")
     
     if rust_result:
-        with open("rust_result.json", "w") as f:
-            json.dump(rust_result, f, indent=2)
+        with open("rust_result.json", "wb") as f:
+            f.write(_dumps(rust_result))
         print("Rust result saved to rust_result.json")
 
 if __name__ == "__main__":
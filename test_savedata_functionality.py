@@ -3,12 +3,25 @@
 Script to test the SaveData functionality with both Python and Rust implementations
 """
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Sample file path
 SAMPLE_FILE = "examples/sample_saves/sample.hoi4"
 
+def _round_trip(save_data):
+    """Save the data to a temporary file and parse it back"""
+    from paradox_savedata.parser import parse_save_file
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        save_data.save(path)
+        return parse_save_file(path)
+    finally:
+        os.remove(path)
+
 def test_python_implementation():
     """Test the Python implementation's SaveData functionality"""
     print("\n1. Testing Python implementation...")
@@ -66,6 +79,191 @@ def test_python_implementation():
     except Exception as e:
         print(f"  ❌ Data modification failed: {e}")
     
+    # Test record tables, blocks of records with the same fields
+    print("\n  Testing record tables:")
+    try:
+        save_data = parse_save_file(SAMPLE_FILE)
+        countries = save_data.countries
+        assert list(countries) == ["IRQ", "GER"]
+        assert countries.GER.name == countries["GER"]["name"] == "Germany"
+        countries.GER.capital = None
+        assert save_data.data["countries"]["GER"]["capital"] is None
+        countries.GER.capital = 65
+        countries.IRQ["treasury"] = 5.5
+        countries["NEW"] = {"name": "New"}
+        countries.FRA = {"name": "France"}
+        data = save_data.data["countries"]
+        assert data["GER"]["capital"] == 65
+        assert data["IRQ"]["treasury"] == 5.5
+        assert data["NEW"] == {"name": "New"}
+        assert data["FRA"] == {"name": "France"}
+        assert _round_trip(save_data).data["countries"] == data
+        del countries["NEW"], countries["FRA"]
+        assert list(save_data.data["countries"]) == ["IRQ", "GER"]
+        # A held record stays on its record when records before it are removed
+        germany = countries.GER
+        del countries["IRQ"]
+        germany.capital = 66
+        assert save_data.data["countries"]["GER"]["capital"] == 66
+        print(f"  ✓ Record tables work: {type(countries).__name__} with {len(countries)} records")
+    except Exception as e:
+        print(f"  ❌ Record tables failed: {e!r}")
+    
+    # Test lists of records with the same fields
+    print("\n  Testing record lists:")
+    try:
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("units={ { id=1 hp=10 } { id=2 hp=20 } }\n")
+            f.write("named={ keys={ id=1 } values={ id=2 } }\n")
+        try:
+            save_data = parse_save_file(path)
+        finally:
+            os.remove(path)
+        units = save_data.units
+        assert [unit.id for unit in units[0:2]] == [1, 2]
+        units[0].hp = 15
+        units.append({"id": 3, "hp": 30})
+        second = units[1]
+        units.insert(0, {"id": 0})
+        # A held record stays on its record when records are inserted before it
+        second.hp = 25
+        assert units.pop()["id"] == 3
+        del units[1]
+        units[1:1] = [{"id": 4}]
+        units[0:2] = [_round_trip(save_data).units[0], {"id": 5}]
+        expected = [{"id": 0}, {"id": 5}, {"id": 2, "hp": 25}]
+        assert save_data.data["units"] == expected, save_data.data["units"]
+        assert _round_trip(save_data).data["units"] == expected
+        # Records named like table methods stay reachable as attributes
+        assert (save_data.named.keys.id, save_data.named.values.id) == (1, 2)
+        print(f"  ✓ Record lists work: {save_data.data['units']}")
+    except Exception as e:
+        print(f"  ❌ Record lists failed: {e!r}")
+    
+    # Test lists of numbers, which are stored packed
+    print("\n  Testing numeric lists:")
+    try:
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("ints={ 1 2 3 } floats={ 0.5 1.5 }\n")
+        try:
+            save_data = parse_save_file(path)
+        finally:
+            os.remove(path)
+        ints, floats = save_data.ints, save_data.floats
+        assert ints == [1, 2, 3] and floats == [0.5, 1.5]
+        ints[0:1] = [5]
+        ints[1:1] = [6, 7]
+        floats[::2] = [2.5]
+        ints.append("x")
+        assert save_data.data["ints"] == [5, 6, 7, 2, 3, "x"]
+        assert save_data.data["floats"] == [2.5, 1.5]
+        assert _round_trip(save_data).data["ints"] == [5, 6, 7, 2, 3, "x"]
+        print(f"  ✓ Numeric lists work: {save_data.data['ints']}, {save_data.data['floats']}")
+    except Exception as e:
+        print(f"  ❌ Numeric lists failed: {e!r}")
+    
+    # Test that changes through every access path are saved
+    print("\n  Testing saving changes:")
+    try:
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("items={ { a=1 } { b=2 } }\n")
+        try:
+            changes = [
+                (SAMPLE_FILE, "attribute", lambda s: setattr(s.countries.IRQ, "capital", 1),
+                 lambda s: s.countries.IRQ.capital == 1),
+                (SAMPLE_FILE, "[]", lambda s: s["countries"]["IRQ"].__setitem__("capital", 2),
+                 lambda s: s.countries.IRQ.capital == 2),
+                (SAMPLE_FILE, "get() record",
+                 lambda s: setattr(s.get("countries.IRQ"), "capital", 3),
+                 lambda s: s.countries.IRQ.capital == 3),
+                (SAMPLE_FILE, "get() block",
+                 lambda s: setattr(s.get("countries.IRQ.politics"), "ruling_party", "x"),
+                 lambda s: s.countries.IRQ.politics.ruling_party == "x"),
+                (path, "list item", lambda s: setattr(s.items[1], "b", 4),
+                 lambda s: s.items[1].b == 4),
+                (path, "slice", lambda s: setattr(s.items[0:1][0], "a", 5),
+                 lambda s: s.items[0].a == 5),
+            ]
+            for source, name, change, changed in changes:
+                save_data = parse_save_file(source)
+                change(save_data)
+                # An unmodified tree would be saved as a copy of the source
+                assert changed(_round_trip(save_data)), f"change through {name} was not saved"
+        finally:
+            os.remove(path)
+        print(f"  ✓ Saving changes works: {', '.join(name for _, name, _, _ in changes)}")
+    except Exception as e:
+        print(f"  ❌ Saving changes failed: {e!r}")
+    
+    # Test that strings with special characters are quoted when saved
+    print("\n  Testing string quoting:")
+    try:
+        from paradox_savedata.parser import SaveData
+        values = {"hash": "x#y", "spaced": "a # b", "brace": "{x}", "empty": ""}
+        save_data = SaveData({"top": dict(values)})
+        assert _round_trip(save_data).data["top"] == values
+        print(f"  ✓ String quoting works: {values}")
+    except Exception as e:
+        print(f"  ❌ String quoting failed: {e!r}")
+    
+    # Test that namespace nodes are shared and released with their block
+    print("\n  Testing namespace nodes:")
+    try:
+        from paradox_savedata.parser import SaveData
+        save_data = SaveData({"a": {"b": {"c": 1}}, "d": {"e": 2}}, namespace=True)
+        node = save_data.a.b
+        assert node is save_data.get("a.b") and node.c == 1
+        replaced = save_data._data["a"]["b"]
+        save_data.a.b = {"c": 2}
+        del node
+        # The node of the replaced block is not kept by the SaveData
+        assert id(replaced) not in save_data._nodes
+        assert save_data.a.b.c == 2 and save_data._data["a"]["b"] == {"c": 2}
+        # Nodes read from the top level stay cached
+        assert save_data.d is save_data.d and save_data.d.e == 2
+        print(f"  ✓ Namespace nodes work: {len(save_data._nodes)} nodes registered")
+    except Exception as e:
+        print(f"  ❌ Namespace nodes failed: {e!r}")
+    
+    # Test field streaming
+    print("\n  Testing field streaming:")
+    try:
+        from paradox_savedata.parser import iter_field
+        treasuries = dict(iter_field("countries.*.treasury", SAMPLE_FILE))
+        assert treasuries["IRQ"] == parse_save_file(SAMPLE_FILE).countries.IRQ.treasury
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("ids={ 5=a 9=b } units={ { hp=1 } { hp=2 } }\n")
+            f.write("nested={ a={ x={ v=1 } } b={ x={ v=2 } y={ v=3 } } }\n")
+        try:
+            # Keys are the ones of the tree, indexes for list blocks
+            assert parse_save_file(path).data["ids"] == ["a", "b"]
+            assert list(iter_field("ids.*", path)) == [(0, "a"), (1, "b")]
+            assert list(iter_field("ids.1", path)) == [(1, "b")]
+            assert list(iter_field("units.*.hp", path)) == [(0, 1), (1, 2)]
+            assert list(iter_field("units.1", path)) == [(1, {"hp": 2})]
+            assert list(iter_field("nested.*.*.v", path)) == [("x", 1), ("x", 2), ("y", 3)]
+            assert list(iter_field("nested.b.*", path)) == [("x", {"v": 2}), ("y", {"v": 3})]
+            assert list(iter_field("nested.c.x", path)) == []
+            assert list(iter_field("ids.5", path)) == []
+        finally:
+            os.remove(path)
+        # A block left open at the end of a truncated file is dropped like by the full parse
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write("b=2 a={ x=1")
+        try:
+            assert "a" not in parse_save_file(path).data
+            assert list(iter_field("a", path)) == [] and list(iter_field("b", path)) == [("b", 2)]
+        finally:
+            os.remove(path)
+        print(f"  ✓ Field streaming works: iter_field(\"countries.*.treasury\") = {treasuries}")
+    except Exception as e:
+        print(f"  ❌ Field streaming failed: {e}")
+    
     # Restore the rust_parser module if it was loaded
     if rust_parser:
         sys.modules['paradox_savedata.parser.rust_parser'] = rust_parser